@@ -1,20 +1,49 @@
 """FastAPI 백엔드 서버 - 커스텀 모델 업로드 지원"""
+from __future__ import annotations
+
+# 시작 타임라인 기준 시각을 잡기 위해 가장 먼저 import
+from startup import (
+    STARTUP_MODE,
+    heavy,
+    load_manifest,
+    load_structure_cache,
+    preload,
+    save_structure_cache,
+    start_background_preload,
+    timeline,
+)
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from pathlib import Path
-from typing import Optional
-import torch
-import torch.nn as nn
+from typing import TYPE_CHECKING, Optional
+import json
 import shutil
 import uuid
 import os
 
-from models import get_model
-from analyzer import get_model_summary, run_inference_with_activations
+# torch, models, analyzer는 무거우므로 startup.heavy를 통해 지연 import
+if TYPE_CHECKING:
+    import torch.nn as nn
+
+timeline.mark("fastapi_imported")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if STARTUP_MODE == "eager":
+        preload(heavy, _get_summary)
+    elif STARTUP_MODE == "background":
+        start_background_preload(heavy, _get_summary)
+    timeline.mark("server_ready", cached_models=len(structure_cache))
+    # lazy/background 모드의 나머지 import는 이후 별도로 출력됨
+    timeline.print("server ready")
+    yield
 
-app = FastAPI(title="AI Model Viewer API")
+
+app = FastAPI(title="AI Model Viewer API", lifespan=lifespan)
 
 # 디렉토리 설정
 BACKEND_DIR = Path(__file__).resolve().parent
@@ -26,6 +55,11 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 # 업로드된 모델 저장소 (메모리)
 uploaded_models: dict = {}
 
+# 모델 구조 요약 캐시 (model_name -> get_model_summary 결과)
+# manifest 모델은 디스크 캐시(structure_cache.json)에서 읽어 재시작 직후에도 torch 없이 응답
+manifest_models = load_manifest()
+structure_cache: dict = load_structure_cache()
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -45,6 +79,16 @@ def root():
     return {"message": "AI Model Viewer API"}
 
 
+@app.get("/startup")
+def startup_timeline():
+    """서버 시작 타임라인 및 preload 상태 반환"""
+    return {
+        **timeline.as_dict(),
+        "heavy_modules_ready": heavy.ready.is_set(),
+        "cached_models": list(structure_cache),
+    }
+
+
 @app.get("/models")
 def list_models():
     """사용 가능한 모델 목록 반환 (기본 + 업로드된 모델)"""
@@ -66,7 +110,7 @@ def list_models():
 
 
 @app.post("/models/upload")
-async def upload_model(
+def upload_model(
     file: UploadFile = File(...),
     name: str = Form(...),
     model_type: str = Form("cnn"),
@@ -88,6 +132,7 @@ async def upload_model(
             shutil.copyfileobj(file.file, buffer)
 
         # 모델 로드 테스트
+        torch = heavy.get("torch")
         model = torch.load(file_path, map_location="cpu", weights_only=False)
 
         if isinstance(model, dict):
@@ -106,7 +151,8 @@ async def upload_model(
         }
 
         # 구조 분석
-        summary = get_model_summary(model)
+        summary = heavy.get("analyzer").get_model_summary(model)
+        structure_cache[model_id] = summary
 
         return {
             "success": True,
@@ -138,6 +184,7 @@ def delete_model(model_id: str):
         os.remove(file_path)
 
     del uploaded_models[model_id]
+    structure_cache.pop(model_id, None)
     return {"success": True}
 
 
@@ -145,17 +192,31 @@ def _load_model(model_name: str) -> nn.Module:
     """모델 이름으로 모델 객체 반환 (기본 + 커스텀)"""
     if model_name in uploaded_models:
         info = uploaded_models[model_name]
-        return torch.load(info["file_path"], map_location="cpu", weights_only=False)
-    return get_model(model_name)
+        return heavy.get("torch").load(info["file_path"], map_location="cpu", weights_only=False)
+    return heavy.get("models").get_model(model_name)
+
+
+def _get_summary(model_name: str) -> dict:
+    """모델 구조 요약 반환 (캐시에 있으면 무거운 모듈 없이 바로 응답)"""
+    summary = structure_cache.get(model_name)
+    if summary is None:
+        model = _load_model(model_name)
+        summary = heavy.get("analyzer").get_model_summary(model)
+        # JSON 왕복을 거쳐 디스크 캐시에서 읽은 값과 같은 형태로 저장 (tuple -> list)
+        summary = json.loads(json.dumps(summary))
+        structure_cache[model_name] = summary
+        if model_name in manifest_models and model_name not in uploaded_models:
+            save_structure_cache({
+                name: structure_cache[name] for name in manifest_models if name in structure_cache
+            })
+    return summary
 
 
 @app.get("/models/{model_name}")
 def get_model_info(model_name: str):
     """특정 모델의 구조 정보 반환"""
     try:
-        model = _load_model(model_name)
-        summary = get_model_summary(model)
-        return summary
+        return _get_summary(model_name)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -164,8 +225,7 @@ def get_model_info(model_name: str):
 def get_model_layers(model_name: str):
     """모델의 레이어 정보만 반환"""
     try:
-        model = _load_model(model_name)
-        summary = get_model_summary(model)
+        summary = _get_summary(model_name)
         return {"layers": summary["layers"]}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -186,7 +246,9 @@ def run_inference(model_name: str):
         else:
             image_path = None
 
-        result = run_inference_with_activations(model, model_name, image_path)
+        analyzer = heavy.get("analyzer")
+        heavy.get("matplotlib.cm")  # activation_to_image의 컬러맵 (import 시간을 타임라인에 기록)
+        result = analyzer.run_inference_with_activations(model, model_name, image_path)
         return result
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
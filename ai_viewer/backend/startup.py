@@ -0,0 +1,185 @@
+"""백엔드 시작 최적화 - 무거운 모듈 지연 import, 백그라운드 preload, 구조 캐시, 시작 타임라인"""
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List
+
+# 타임라인 기준 시각 (main.py가 가장 먼저 import 하므로 사실상 프로세스 시작 시점)
+_T0 = time.perf_counter()
+
+BACKEND_DIR = Path(__file__).resolve().parent
+MANIFEST_PATH = Path(os.environ.get("PRELOAD_MANIFEST", BACKEND_DIR / "preload_manifest.json"))
+# manifest 모델의 구조 요약을 재시작 후에도 무거운 import 없이 쓰기 위한 캐시 파일
+STRUCTURE_CACHE_PATH = MANIFEST_PATH.with_name("structure_cache.json")
+# 이 파일들이 바뀌면 구조 요약도 달라질 수 있으므로 mtime을 캐시 키로 사용
+STRUCTURE_CACHE_SOURCES = [BACKEND_DIR / "models.py", BACKEND_DIR / "analyzer.py"]
+
+# lazy: 필요한 모듈만 첫 사용 시 import
+# background: 서버가 뜬 직후 백그라운드 스레드에서 전체 preload (기본)
+# eager: 서버가 요청을 받기 전에 전체 preload 및 manifest 모델 prewarm
+STARTUP_MODE = os.environ.get("STARTUP_MODE", "background")
+if STARTUP_MODE not in ("lazy", "background", "eager"):
+    raise ValueError(f"Unknown STARTUP_MODE: {STARTUP_MODE}")
+
+# 무거운 모듈 -> 먼저 import 할 의존 모듈 (preload는 이 순서대로 전체 로드)
+# matplotlib.cm은 analyzer.activation_to_image가 호출 시점에만 쓰므로 analyzer 의존성에 넣지 않음
+HEAVY_MODULES: Dict[str, List[str]] = {
+    "torch": [],
+    "numpy": [],
+    "PIL.Image": [],
+    "models": ["torch"],
+    "analyzer": ["torch", "numpy", "PIL.Image"],
+    "matplotlib.cm": ["numpy"],
+}
+
+
+class StartupTimeline:
+    """시작 과정의 이벤트를 _T0 기준 경과 시간(ms)으로 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.events: List[Dict[str, Any]] = []
+
+    def mark(self, event: str, **extra: Any) -> float:
+        elapsed = (time.perf_counter() - _T0) * 1000
+        with self._lock:
+            self.events.append({"event": event, "t_ms": round(elapsed, 1), **extra})
+        return elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"mode": STARTUP_MODE, "events": list(self.events)}
+
+    def print(self, title: str) -> None:
+        print(f"[startup] {title} (mode={STARTUP_MODE})")
+        for e in self.as_dict()["events"]:
+            extra = ", ".join(f"{k}={v}" for k, v in e.items() if k not in ("event", "t_ms"))
+            print(f"[startup]   {e['t_ms']:>9.1f} ms  {e['event']}" + (f"  ({extra})" if extra else ""))
+
+
+class HeavyModules:
+    """torch / numpy / PIL / matplotlib 및 이를 쓰는 models, analyzer를 첫 사용 시 import
+
+    모듈마다 따로 잠그므로, 백그라운드 preload가 matplotlib을 import 하는 중에도
+    torch만 필요한 요청은 torch 로드가 끝나는 대로 진행된다.
+    """
+
+    def __init__(self, timeline: StartupTimeline):
+        self.timeline = timeline
+        self.ready = threading.Event()
+        self.loaded: set = set()
+        self._locks = {name: threading.Lock() for name in HEAVY_MODULES}
+        self._ready_lock = threading.Lock()
+
+    def get(self, name: str) -> ModuleType:
+        """name과 그 의존 모듈만 import 해서 반환"""
+        if name not in self.loaded:
+            with self._locks[name]:
+                if name not in self.loaded:
+                    for dep in HEAVY_MODULES[name]:
+                        self.get(dep)
+                    start = time.perf_counter()
+                    importlib.import_module(name)
+                    duration = (time.perf_counter() - start) * 1000
+                    self.timeline.mark(
+                        f"import {name}",
+                        duration_ms=round(duration, 1),
+                        thread=threading.current_thread().name,
+                    )
+                    if STARTUP_MODE == "lazy":
+                        print(f"[startup] import {name} on first use: {duration:.1f} ms")
+                    self.loaded.add(name)
+            self._check_ready()
+        return importlib.import_module(name)
+
+    def load(self) -> None:
+        """모든 무거운 모듈 import"""
+        for name in HEAVY_MODULES:
+            self.get(name)
+
+    def _check_ready(self) -> None:
+        if self.ready.is_set() or len(self.loaded) < len(HEAVY_MODULES):
+            return
+        with self._ready_lock:
+            if self.ready.is_set():
+                return
+            self.timeline.mark("heavy_modules_ready")
+            self.ready.set()
+        self.timeline.print("heavy modules ready")
+
+
+def load_manifest() -> List[str]:
+    """preload manifest에서 미리 구조를 캐싱할 모델 이름 목록 읽기"""
+    if not MANIFEST_PATH.exists():
+        return []
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+        return list(json.load(f).get("models", []))
+
+
+def _structure_cache_key() -> Dict[str, int]:
+    return {path.name: path.stat().st_mtime_ns for path in STRUCTURE_CACHE_SOURCES}
+
+
+def load_structure_cache() -> Dict[str, Any]:
+    """디스크의 구조 요약 캐시 읽기 (models.py / analyzer.py가 바뀌었으면 무시)"""
+    try:
+        with open(STRUCTURE_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("key") != _structure_cache_key():
+        timeline.mark("structure_cache_stale")
+        return {}
+    summaries = data.get("models", {})
+    timeline.mark("structure_cache_loaded", models=len(summaries))
+    return summaries
+
+
+def save_structure_cache(summaries: Dict[str, Any]) -> None:
+    """구조 요약 캐시를 디스크에 저장 (임시 파일에 쓴 뒤 교체)"""
+    data = {"key": _structure_cache_key(), "models": summaries}
+    tmp_name = f".{STRUCTURE_CACHE_PATH.name}.{os.getpid()}.{threading.get_ident()}"
+    tmp_path = STRUCTURE_CACHE_PATH.with_name(tmp_name)
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, STRUCTURE_CACHE_PATH)
+    except OSError as e:
+        timeline.mark("structure_cache_save_failed", error=str(e))
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def preload(heavy: HeavyModules, prewarm: Callable[[str], Any]) -> None:
+    """무거운 모듈을 로드하고 manifest의 모델들을 prewarm"""
+    heavy.load()
+    start = time.perf_counter()
+    models = load_manifest()
+    for model_name in models:
+        model_start = time.perf_counter()
+        try:
+            prewarm(model_name)
+        except Exception as e:
+            heavy.timeline.mark(f"prewarm {model_name}", error=str(e))
+            continue
+        duration = (time.perf_counter() - model_start) * 1000
+        heavy.timeline.mark(f"prewarm {model_name}", duration_ms=round(duration, 1))
+    elapsed = heavy.timeline.mark("preload_done")
+    print(f"[startup] preload done at {elapsed:.1f} ms "
+          f"({len(models)} model(s) prewarmed in {(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+def start_background_preload(heavy: HeavyModules, prewarm: Callable[[str], Any]) -> threading.Thread:
+    thread = threading.Thread(target=preload, args=(heavy, prewarm), name="preload", daemon=True)
+    thread.start()
+    return thread
+
+
+timeline = StartupTimeline()
+heavy = HeavyModules(timeline)
@@ -0,0 +1,150 @@
+"""analyzer 벤치마크 - 깊이/너비를 키운 합성 모델로 구조 분석, 추론, feature map 변환 측정"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from common import BACKEND_DIR, add_import_path, measure
+
+add_import_path(BACKEND_DIR)
+
+import torch  # noqa: E402
+import torch.nn as nn  # noqa: E402
+
+from analyzer import (  # noqa: E402
+    activation_to_image,
+    get_model_summary,
+    run_inference_with_activations,
+)
+from models import MiniTransformer, TinyResNet  # noqa: E402
+
+
+class BasicBlock(nn.Module):
+    """TinyResNet의 Residual Block과 같은 구성 (conv-bn-relu-conv-bn + 1x1 shortcut)"""
+
+    def __init__(self, in_channels: int, out_channels: int):
+        super().__init__()
+        self.conv1 = nn.Conv2d(in_channels, out_channels, kernel_size=3, padding=1)
+        self.bn1 = nn.BatchNorm2d(out_channels)
+        self.relu = nn.ReLU(inplace=True)
+        self.conv2 = nn.Conv2d(out_channels, out_channels, kernel_size=3, padding=1)
+        self.bn2 = nn.BatchNorm2d(out_channels)
+        self.downsample = nn.Conv2d(in_channels, out_channels, kernel_size=1)
+
+    def forward(self, x):
+        identity = self.downsample(x)
+        x = self.relu(self.bn1(self.conv1(x)))
+        x = self.bn2(self.conv2(x))
+        return self.relu(x + identity)
+
+
+class ScaledResNet(nn.Module):
+    """TinyResNet을 block 수(depth)와 채널 수(width)로 확장한 모델"""
+
+    def __init__(self, num_blocks: int, width: int, num_classes: int = 10):
+        super().__init__()
+        self.conv1 = nn.Conv2d(3, width, kernel_size=3, padding=1)
+        self.bn1 = nn.BatchNorm2d(width)
+        self.relu = nn.ReLU(inplace=True)
+        self.pool1 = nn.MaxPool2d(2, 2)
+        self.blocks = nn.Sequential(*[BasicBlock(width, width) for _ in range(num_blocks)])
+        self.avgpool = nn.AdaptiveAvgPool2d((1, 1))
+        self.fc = nn.Linear(width, num_classes)
+
+    def forward(self, x):
+        x = self.pool1(self.relu(self.bn1(self.conv1(x))))
+        x = self.blocks(x)
+        x = self.avgpool(x)
+        x = torch.flatten(x, 1)
+        return self.fc(x)
+
+
+def plain_cnn(depth: int, width: int) -> nn.Module:
+    """Conv-BN-ReLU를 depth번 쌓은 Sequential (analyze_model 기준 레이어 수 = 3 * depth)"""
+    layers: List[nn.Module] = []
+    in_channels = 3
+    for _ in range(depth):
+        layers += [
+            nn.Conv2d(in_channels, width, kernel_size=3, padding=1),
+            nn.BatchNorm2d(width),
+            nn.ReLU(inplace=True),
+        ]
+        in_channels = width
+    return nn.Sequential(*layers)
+
+
+ModelSpec = Tuple[str, str, Callable[[], nn.Module]]
+
+
+def model_specs(quick: bool) -> List[ModelSpec]:
+    """(라벨, run_inference_with_activations에 넘길 model_name, 생성 함수) 목록"""
+    depths = (4, 16) if quick else (4, 16, 48)
+    widths = (16, 64) if quick else (16, 64, 128)
+    blocks = (1, 4) if quick else (1, 4, 8)
+    tf_layers = (2, 6) if quick else (2, 6, 12)
+    tf_dims = (64, 128) if quick else (64, 128, 256)
+
+    specs: List[ModelSpec] = [
+        ("tiny_resnet", "tiny_resnet", TinyResNet),
+        ("mini_transformer", "mini_transformer", MiniTransformer),
+    ]
+    for d in depths:
+        for w in widths:
+            specs.append((f"cnn-d{d}-w{w}", "custom", lambda d=d, w=w: plain_cnn(d, w)))
+    for b in blocks:
+        for w in widths:
+            specs.append((f"resnet-b{b}-w{w}", "custom", lambda b=b, w=w: ScaledResNet(b, w)))
+    for n in tf_layers:
+        for dim in tf_dims:
+            # run_inference_with_activations는 mini_transformer 입력으로 길이 16, vocab 1000 토큰을 만든다
+            specs.append((
+                f"transformer-l{n}-d{dim}",
+                "mini_transformer",
+                lambda n=n, dim=dim: MiniTransformer(d_model=dim, num_layers=n),
+            ))
+    return specs
+
+
+def activation_shapes(quick: bool) -> List[Tuple[str, Tuple[int, ...]]]:
+    """activation_to_image가 처리하는 텐서 형태별 입력 (CNN / Transformer / FC)"""
+    shapes = [
+        ("cnn-16x32x32", (1, 16, 32, 32)),
+        ("cnn-64x16x16", (1, 64, 16, 16)),
+        ("seq-16x64", (1, 16, 64)),
+        ("fc-10", (1, 10)),
+        ("fc-1024", (1, 1024)),
+    ]
+    if not quick:
+        shapes += [
+            ("cnn-256x32x32", (1, 256, 32, 32)),
+            ("seq-128x256", (1, 128, 256)),
+        ]
+    return shapes
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    summary_repeat = 5 if quick else 20
+    inference_repeat = 2 if quick else 5
+    image_repeat = 10 if quick else 50
+
+    for label, model_name, factory in model_specs(quick):
+        torch.manual_seed(0)
+        model = factory()
+        results[f"analyzer.get_model_summary[{label}]"] = measure(
+            lambda: get_model_summary(model), summary_repeat
+        )
+        torch.manual_seed(0)
+        stats = measure(
+            lambda: run_inference_with_activations(model, model_name), inference_repeat
+        )
+        stats["layers"] = len(get_model_summary(model)["layers"])
+        results[f"analyzer.run_inference_with_activations[{label}]"] = stats
+
+    generator = torch.Generator().manual_seed(0)
+    for label, shape in activation_shapes(quick):
+        activation = torch.randn(shape, generator=generator)
+        results[f"analyzer.activation_to_image[{label}]"] = measure(
+            lambda: activation_to_image(activation), image_repeat
+        )
+
+    return results
@@ -0,0 +1,140 @@
+"""백엔드 API 벤치마크 - FastAPI 앱을 프로세스 내(ASGI)로 호출해 지연시간과 동시 처리량 측정"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common import BACKEND_DIR, add_import_path, summarize
+
+add_import_path(BACKEND_DIR)
+
+# main은 import 시 manifest 옆의 structure_cache.json을 읽고, 구조 조회 시 다시 쓴다.
+# 실제 서버의 캐시 파일을 건드리지 않도록 manifest를 임시 디렉토리로 복사해 사용
+_BENCH_DIR = Path(tempfile.mkdtemp(prefix="ai-viewer-bench-"))
+atexit.register(shutil.rmtree, _BENCH_DIR, ignore_errors=True)
+shutil.copy(BACKEND_DIR / "preload_manifest.json", _BENCH_DIR / "preload_manifest.json")
+os.environ["PRELOAD_MANIFEST"] = str(_BENCH_DIR / "preload_manifest.json")
+
+import httpx  # noqa: E402
+import torch  # noqa: E402
+
+import main  # noqa: E402
+from main import app  # noqa: E402
+
+# (method, path) - 가벼운 것부터 무거운 순서
+LATENCY_ENDPOINTS: List[Tuple[str, str]] = [
+    ("GET", "/"),
+    ("GET", "/models"),
+    ("GET", "/models/tiny_resnet"),
+    ("GET", "/models/mini_transformer"),
+    ("GET", "/models/tiny_resnet/layers"),
+    ("POST", "/inference/tiny_resnet"),
+    ("POST", "/inference/mini_transformer"),
+]
+
+# 구조 조회는 캐시되므로, 매 요청 전에 캐시를 비워 모델 생성 + 분석 비용도 따로 측정
+UNCACHED_ENDPOINTS: List[Tuple[str, str, str]] = [
+    ("GET", "/models/tiny_resnet", "tiny_resnet"),
+    ("GET", "/models/mini_transformer", "mini_transformer"),
+]
+
+LOAD_ENDPOINTS: List[Tuple[str, str]] = [
+    ("GET", "/models"),
+    ("GET", "/models/tiny_resnet"),
+    ("POST", "/inference/tiny_resnet"),
+]
+
+
+async def _request(client: httpx.AsyncClient, method: str, path: str) -> None:
+    response = await client.request(method, path)
+    if response.status_code != 200:
+        raise RuntimeError(f"{method} {path} -> {response.status_code}: {response.text[:200]}")
+
+
+async def _latency(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    repeat: int,
+    before: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """before가 주어지면 매 요청 직전에 (측정 시간 밖에서) 호출"""
+    await _request(client, method, path)  # warmup
+    samples = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        await _request(client, method, path)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def _load(
+    client: httpx.AsyncClient, method: str, path: str, concurrency: int, total: int
+) -> Dict[str, Any]:
+    """concurrency개 요청을 동시에 유지하며 total개를 처리하는 데 걸린 시간으로 처리량 계산"""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await _request(client, method, path)
+            samples.append(time.perf_counter() - start)
+
+    await _request(client, method, path)  # warmup
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+
+    stats = summarize(samples)
+    stats.update({
+        "rps": total / elapsed,
+        "concurrency": concurrency,
+        "total_requests": total,
+        "elapsed_s": elapsed,
+    })
+    return stats
+
+
+async def _run(quick: bool) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    latency_repeat = 5 if quick else 30
+    concurrency_levels = (1, 8) if quick else (1, 8, 32)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for method, path in LATENCY_ENDPOINTS:
+            repeat = max(2, latency_repeat // 5) if path.startswith("/inference") else latency_repeat
+            torch.manual_seed(0)
+            results[f"endpoints.latency[{method} {path}]"] = await _latency(client, method, path, repeat)
+
+        for method, path, model_name in UNCACHED_ENDPOINTS:
+            torch.manual_seed(0)
+            results[f"endpoints.latency[{method} {path} uncached]"] = await _latency(
+                client, method, path, latency_repeat,
+                before=lambda: main.structure_cache.pop(model_name, None),
+            )
+
+        for method, path in LOAD_ENDPOINTS:
+            total = 20 if path.startswith("/inference") else 200
+            if quick:
+                total //= 4
+            for concurrency in concurrency_levels:
+                torch.manual_seed(0)
+                results[f"endpoints.load[{method} {path} c={concurrency}]"] = await _load(
+                    client, method, path, concurrency, total
+                )
+
+    return results
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, Any]]:
+    return asyncio.run(_run(quick))
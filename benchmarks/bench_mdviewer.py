@@ -0,0 +1,104 @@
+"""md-viewer 벤치마크 - 생성한 대규모 디렉토리 트리에서 browse/files/read API 측정"""
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict
+
+from common import MD_VIEWER_DIR, add_import_path, measure
+
+add_import_path(MD_VIEWER_DIR)
+
+import server  # noqa: E402
+
+MD_LINE = "Experiment note line with `code`, **bold** text and a [link](https://example.com).\n"
+
+
+class QuietHandler(server.MDViewerHandler):
+    """요청마다 stderr에 찍히는 access log가 측정을 방해하지 않도록 끔"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def build_tree(root: Path, flat_files: int, nested_dirs: int, files_per_dir: int) -> Dict[str, Path]:
+    """측정용 트리 생성
+
+    - flat/: 파일 flat_files개가 한 디렉토리에 (md 2/3, 그 외 확장자 1/3)
+    - nested/dir_XXXX/: nested_dirs개 디렉토리에 각 files_per_dir개
+    - docs/: 크기별 md 파일 (1KB, 100KB, 1MB)
+    """
+    rng = random.Random(0)
+    flat = root / "flat"
+    flat.mkdir()
+    for i in range(flat_files):
+        ext = ".md" if i % 3 else rng.choice([".txt", ".json", ".png"])
+        (flat / f"note_{i:05d}{ext}").write_text(MD_LINE, encoding="utf-8")
+    for i in range(max(1, flat_files // 100)):
+        (flat / f"subdir_{i:03d}").mkdir()
+
+    nested = root / "nested"
+    nested.mkdir()
+    for d in range(nested_dirs):
+        sub = nested / f"dir_{d:04d}"
+        sub.mkdir()
+        for i in range(files_per_dir):
+            (sub / f"run_{i:03d}.md").write_text(MD_LINE, encoding="utf-8")
+
+    docs = root / "docs"
+    docs.mkdir()
+    paths = {"flat": flat, "nested": nested, "nested_child": nested / "dir_0000"}
+    for label, size in (("1KB", 1 << 10), ("100KB", 100 << 10), ("1MB", 1 << 20)):
+        path = docs / f"doc_{label}.md"
+        path.write_text(MD_LINE * (size // len(MD_LINE) + 1), encoding="utf-8")
+        paths[f"doc_{label}"] = path
+    return paths
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    flat_files = 10_000
+    nested_dirs, files_per_dir = (50, 100) if quick else (200, 100)
+    repeat = 10 if quick else 30
+
+    root = Path(tempfile.mkdtemp(prefix="md-viewer-bench-"))
+    httpd = server.MDViewerServer(("127.0.0.1", 0), QuietHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    def call(endpoint: str, **params: str) -> None:
+        url = f"{base_url}{endpoint}?{urllib.parse.urlencode(params)}"
+        # 뷰어처럼 응답 전체를 받아 파싱해야 큰 listing/파일의 실제 비용이 측정됨
+        with urllib.request.urlopen(url) as response:
+            data = json.loads(response.read())
+        if not data["success"]:
+            raise RuntimeError(f"{url} failed: {data.get('error')}")
+
+    try:
+        paths = build_tree(root, flat_files, nested_dirs, files_per_dir)
+        total_files = flat_files + nested_dirs * files_per_dir
+
+        for label in ("flat", "nested", "nested_child"):
+            target = str(paths[label])
+            results[f"mdviewer.browse[{label}]"] = measure(lambda: call("/api/browse", dir=target), repeat)
+            results[f"mdviewer.files[{label}]"] = measure(lambda: call("/api/files", dir=target), repeat)
+
+        for label in ("1KB", "100KB", "1MB"):
+            target = str(paths[f"doc_{label}"])
+            results[f"mdviewer.read[{label}]"] = measure(lambda: call("/api/read", path=target), repeat)
+
+        for stats in results.values():
+            stats["tree_files"] = total_files
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        shutil.rmtree(root, ignore_errors=True)
+
+    return results
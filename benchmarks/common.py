@@ -0,0 +1,119 @@
+"""벤치마크 공통 유틸 - 측정, 경로 설정, 결과 저장/비교"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REPO_ROOT / "ai_viewer" / "backend"
+MD_VIEWER_DIR = REPO_ROOT / "md-viewer"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def add_import_path(path: Path) -> None:
+    """백엔드/md-viewer 모듈을 스크립트 실행 방식 그대로 import 할 수 있게 경로 추가"""
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """측정값(초) 리스트를 ms 단위 통계로 요약"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "unit": "ms",
+        "n": len(ordered),
+        "min": ordered[0] * 1000,
+        "median": statistics.median(ordered) * 1000,
+        "mean": statistics.fmean(ordered) * 1000,
+        "p95": ordered[p95_index] * 1000,
+        "stdev": statistics.stdev(ordered) * 1000 if len(ordered) > 1 else 0.0,
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    """fn을 warmup 후 repeat 회 실행하고 지연시간 통계 반환"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info() -> Dict[str, Any]:
+    """결과 비교 시 참고할 실행 환경 정보"""
+    info = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        import torch
+        info["torch"] = torch.__version__
+        info["torch_threads"] = torch.get_num_threads()
+    except ImportError:
+        pass
+    return info
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[str]:
+    """두 결과의 median을 비교해 표를 출력하고, threshold 이상 느려진 항목 반환
+
+    처리량(throughput) 항목은 값이 클수록 좋으므로 방향을 반대로 비교한다.
+    """
+    regressions = []
+    base_benchmarks = baseline.get("benchmarks", {})
+    print(f"\n{'benchmark':<60} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, stats in current.get("benchmarks", {}).items():
+        base = base_benchmarks.get(name)
+        if base is None:
+            continue
+        metric = "rps" if "rps" in stats else "median"
+        old, new = base[metric], stats[metric]
+        if not old:
+            continue
+        change = (new - old) / old
+        slower = -change if metric == "rps" else change
+        flag = ""
+        if slower > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<60} {old:>12.3f} {new:>12.3f} {change:>+8.1%}{flag}")
+    return regressions
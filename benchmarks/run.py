@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""벤치마크 실행기
+
+Usage:
+    python benchmarks/run.py                         # 전체 suite
+    python benchmarks/run.py --suite mdviewer --quick
+    python benchmarks/run.py --compare benchmarks/results/baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import RESULTS_DIR, compare_results, environment_info, load_results, save_results  # noqa: E402
+
+# suite 이름 -> 모듈 (각 모듈은 run(quick) -> {benchmark 이름: 통계} 제공)
+SUITES = {
+    "analyzer": "bench_analyzer",
+    "endpoints": "bench_endpoints",
+    "mdviewer": "bench_mdviewer",
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="DaintLab_Tools 벤치마크 (CPU, 오프라인)")
+    parser.add_argument("--suite", action="append", choices=list(SUITES),
+                        help="실행할 suite (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--quick", action="store_true", help="작은 설정으로 빠르게 실행")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="torch CPU 스레드 수 (재현성을 위해 기본 1)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/<시각>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="regression으로 판단할 상대 변화량 (기본 0.10 = 10%%)")
+    args = parser.parse_args()
+
+    # 오프라인 CPU 실행 고정
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    os.environ.setdefault("OMP_NUM_THREADS", str(args.threads))
+    try:
+        import torch
+        torch.set_num_threads(args.threads)
+    except ImportError:
+        pass
+
+    suites = args.suite or list(SUITES)
+    results = {
+        "environment": environment_info(),
+        "config": {"suites": suites, "quick": args.quick, "threads": args.threads},
+        "benchmarks": {},
+    }
+
+    for suite in suites:
+        print(f"[{suite}] running...")
+        module = importlib.import_module(SUITES[suite])
+        suite_results = module.run(quick=args.quick)
+        for name, stats in suite_results.items():
+            summary = f"{stats['rps']:.1f} req/s" if "rps" in stats else f"{stats['median']:.3f} ms"
+            print(f"  {name:<66} {summary}")
+        results["benchmarks"].update(suite_results)
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    save_results(results, output)
+    print(f"\nSaved: {output}")
+
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,16 +4,247 @@ MD Viewer - Simple Markdown viewer server
 Usage: python server.py [port]
 """
 
+import difflib
 import http.server
 import socketserver
 import json
 import os
+import queue
+import threading
 import urllib.parse
 from pathlib import Path
 
 PORT = int(os.environ.get('PORT', 3000))
 DEFAULT_DIR = '/nas/home/qmdlghfl3/home/2026/Bagel'
 
+# Live reload: how often watched paths are stat()ed, and how often an idle
+# SSE connection sends a keepalive comment. A closed client is only noticed
+# on the next write, so this also bounds how long its watcher outlives it.
+WATCH_INTERVAL = float(os.environ.get('WATCH_INTERVAL', 1.0))
+KEEPALIVE_INTERVAL = float(os.environ.get('KEEPALIVE_INTERVAL', 3.0))
+# File changes spanning more lines than this are sent as a `reload` event
+# instead of line patches (bounds both diff time and event size)
+PATCH_MAX_LINES = int(os.environ.get('PATCH_MAX_LINES', 1000))
+
+
+def file_version(stat):
+    """Version token for a file, derived from mtime and size"""
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def read_versioned(file_path):
+    """Read a text file and return (content, version)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        version = file_version(os.fstat(f.fileno()))
+        return f.read(), version
+
+
+def list_entries(target_dir):
+    """Entries shown by the viewer (directories and .md files), name -> is_dir"""
+    entries = {}
+    for item in os.listdir(target_dir):
+        is_dir = os.path.isdir(os.path.join(target_dir, item))
+        if is_dir or item.endswith('.md'):
+            entries[item] = is_dir
+    return entries
+
+
+def line_patches(old_lines, new_lines):
+    """Line-range patches turning old_lines into new_lines, or None when the
+    change is too large to be worth patching (clients reload instead).
+
+    Each patch replaces old_lines[start:end] with `lines`; patches are
+    ordered by position in the old document. The common prefix and suffix
+    are skipped first, so appends and local edits cost O(n) and only the
+    differing middle goes through SequenceMatcher.
+    """
+    prefix = 0
+    limit = min(len(old_lines), len(new_lines))
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    old_mid = old_lines[prefix:len(old_lines) - suffix]
+    new_mid = new_lines[prefix:len(new_lines) - suffix]
+    if len(old_mid) > PATCH_MAX_LINES or len(new_mid) > PATCH_MAX_LINES:
+        return None
+    if not old_mid or not new_mid:
+        return [{'start': prefix, 'end': prefix + len(old_mid), 'lines': new_mid}]
+
+    # autojunk keeps repetitive text (blank lines, separators) from making
+    # the match quadratic; the patches stay correct, just less minimal
+    matcher = difflib.SequenceMatcher(None, old_mid, new_mid)
+    return [
+        {'start': prefix + i1, 'end': prefix + i2, 'lines': new_mid[j1:j2]}
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != 'equal'
+    ]
+
+
+def dir_version(target_dir):
+    """Version token for a directory listing (changes when entries change)"""
+    return str(os.stat(target_dir).st_mtime_ns)
+
+
+class PathWatcher:
+    """Polls one file or directory and fans change events out to subscribers.
+
+    Only the watcher thread reads the disk and updates version/snapshot;
+    `lock` guards the subscriber set and is held just long enough to swap
+    in a new state and publish it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.subscribers = set()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.is_dir = os.path.isdir(path)
+        self.ready = False
+        self.version = None
+        self.snapshot = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def refresh(self):
+        """Read the path from disk; returns (version, snapshot, event) or None
+        if nothing changed. Does not modify the watcher."""
+        old_version, old_snapshot = self.version, self.snapshot
+
+        try:
+            if self.is_dir:
+                version = dir_version(self.path)
+                if version == old_version:
+                    return None
+                snapshot = list_entries(self.path)
+            else:
+                version = file_version(os.stat(self.path))
+                if version == old_version:
+                    return None
+                content, version = read_versioned(self.path)
+                snapshot = content.split('\n')
+        except (FileNotFoundError, NotADirectoryError):
+            if old_version == 'removed':
+                return None
+            return 'removed', None, {'type': 'removed', 'path': self.path}
+
+        if old_version is None:
+            return version, snapshot, None
+
+        event = {
+            'type': 'change',
+            'path': self.path,
+            'base': old_version,
+            'version': version,
+        }
+        if self.is_dir:
+            old_entries = old_snapshot or {}
+            event['kind'] = 'directory'
+            event['added'] = [
+                {'name': name, 'isDirectory': is_dir}
+                for name, is_dir in sorted(snapshot.items())
+                if old_entries.get(name) != is_dir
+            ]
+            event['removed'] = sorted(
+                name for name, is_dir in old_entries.items()
+                if snapshot.get(name) != is_dir
+            )
+        else:
+            event['kind'] = 'file'
+            patches = None if old_snapshot is None else line_patches(old_snapshot, snapshot)
+            if patches is None:
+                # Recreated after removal, or too large a change to patch
+                event = {'type': 'reload', 'path': self.path, 'version': version}
+            else:
+                event['patches'] = patches
+        return version, snapshot, event
+
+    def ready_event(self):
+        return {'type': 'ready', 'path': self.path, 'version': self.version}
+
+    def subscribe(self):
+        """Add a subscriber queue, or return None if the watcher has stopped"""
+        q = queue.Queue()
+        with self.lock:
+            if self.stop_event.is_set():
+                return None
+            self.subscribers.add(q)
+            if self.ready:
+                q.put(self.ready_event())
+        return q
+
+    def unsubscribe(self, q):
+        """Remove a subscriber; stops the watcher and returns True if it was the last"""
+        with self.lock:
+            self.subscribers.discard(q)
+            if self.subscribers:
+                return False
+            self.stop_event.set()
+            return True
+
+    def run(self):
+        interval = 0
+        while not self.stop_event.wait(interval):
+            interval = WATCH_INTERVAL
+            try:
+                result = self.refresh()
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            with self.lock:
+                if result:
+                    self.version, self.snapshot, event = result
+                    if event:
+                        for q in self.subscribers:
+                            q.put(event)
+                if not self.ready:
+                    # First snapshot taken: tell early subscribers the version
+                    self.ready = True
+                    for q in self.subscribers:
+                        q.put(self.ready_event())
+
+
+class WatchRegistry:
+    """One shared PathWatcher per path, created on first subscribe and
+    stopped when the last subscriber leaves"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.watchers = {}
+
+    def subscribe(self, path):
+        path = os.path.realpath(path)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+
+        while True:
+            with self.lock:
+                watcher = self.watchers.get(path)
+                if watcher is None:
+                    watcher = PathWatcher(path)
+                    self.watchers[path] = watcher
+            q = watcher.subscribe()
+            if q is not None:
+                return watcher, q
+            # Stopped by its last subscriber leaving in the meantime
+            with self.lock:
+                if self.watchers.get(path) is watcher:
+                    del self.watchers[path]
+
+    def unsubscribe(self, watcher, q):
+        if watcher.unsubscribe(q):
+            with self.lock:
+                if self.watchers.get(watcher.path) is watcher:
+                    del self.watchers[watcher.path]
+
+
+watch_registry = WatchRegistry()
+
+
 class MDViewerHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(Path(__file__).parent / 'public'), **kwargs)
@@ -28,6 +259,8 @@ class MDViewerHandler(http.server.SimpleHTTPRequestHandler):
             self.handle_read(query)
         elif parsed.path == '/api/files':
             self.handle_files(query)
+        elif parsed.path == '/api/watch':
+            self.handle_watch(query)
         else:
             super().do_GET()
 
@@ -43,6 +276,9 @@ class MDViewerHandler(http.server.SimpleHTTPRequestHandler):
         target_dir = query.get('dir', [DEFAULT_DIR])[0]
 
         try:
+            # Taken before listing, so a concurrent change makes it stale
+            # rather than newer than the items
+            version = dir_version(target_dir)
             items = []
             for item in os.listdir(target_dir):
                 full_path = os.path.join(target_dir, item)
@@ -64,7 +300,8 @@ class MDViewerHandler(http.server.SimpleHTTPRequestHandler):
                 'success': True,
                 'items': items,
                 'dir': target_dir,
-                'parent': os.path.dirname(target_dir)
+                'parent': os.path.dirname(target_dir),
+                'version': version
             })
         except Exception as e:
             self.send_json({'success': False, 'error': str(e)})
@@ -77,13 +314,13 @@ class MDViewerHandler(http.server.SimpleHTTPRequestHandler):
             return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content, version = read_versioned(file_path)
 
             self.send_json({
                 'success': True,
                 'content': content,
-                'filename': os.path.basename(file_path)
+                'filename': os.path.basename(file_path),
+                'version': version
             })
         except Exception as e:
             self.send_json({'success': False, 'error': str(e)})
@@ -114,12 +351,53 @@ class MDViewerHandler(http.server.SimpleHTTPRequestHandler):
         except Exception as e:
             self.send_json({'success': False, 'error': str(e)})
 
+    def handle_watch(self, query):
+        """Server-Sent Events stream of changes to a file or directory"""
+        target_path = query.get('path', [None])[0]
+
+        if not target_path:
+            self.send_json({'success': False, 'error': 'path parameter required'})
+            return
+
+        try:
+            watcher, events = watch_registry.subscribe(target_path)
+        except Exception as e:
+            self.send_json({'success': False, 'error': str(e)})
+            return
+
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+
+            while True:
+                try:
+                    event = events.get(timeout=KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    self.wfile.write(b': keepalive\n\n')
+                else:
+                    data = json.dumps(event, ensure_ascii=False)
+                    self.wfile.write(f"event: {event['type']}\ndata: {data}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except OSError:
+            # Client went away (reset, abort, broken pipe or write timeout)
+            pass
+        finally:
+            watch_registry.unsubscribe(watcher, events)
+
+
+class MDViewerServer(socketserver.ThreadingTCPServer):
+    # Watch streams hold their connection open, so each request gets a thread
+    daemon_threads = True
+    allow_reuse_address = True
+
 
 def main():
     import sys
     port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
 
-    with socketserver.TCPServer(("", port), MDViewerHandler) as httpd:
+    with MDViewerServer(("", port), MDViewerHandler) as httpd:
         print(f"MD Viewer running at http://localhost:{port}")
         print(f"Default directory: {DEFAULT_DIR}")
         print("Press Ctrl+C to stop")